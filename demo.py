@@ -15,7 +15,7 @@ chunk_file = data_dir / T(t"chunk_{idx:04d}-of-{total:04d}.parquet")
 
 # Inspect what's needed
 print("Required params:", chunk_file.required_params())
-# -> {'root', 'dataset', 'idx', 'total'}
+# -> frozenset({'root', 'dataset', 'idx', 'total'})
 
 # Resolve with bindings
 path = chunk_file.resolve(
@@ -29,6 +29,14 @@ path = chunk_file.resolve(
 print("Resolved:", path)
 # -> /mnt/storage/data/train/chunk_0007-of-0100.parquet
 
+# Resolve many bindings at once (the expression is compiled once)
+paths = chunk_file.resolve_many(
+    {"root": "/mnt/storage", "dataset": "train", "idx": i, "total": 100}
+    for i in range(3)
+)
+print("Batch:", paths[-1])
+# -> /mnt/storage/data/train/chunk_0002-of-0100.parquet
+
 # Constant folding happens at construction
 folded = P("/home") / "user" / "data"
 print("Folded type:", type(folded).__name__)
@@ -42,7 +50,7 @@ print("Parent of join:", expr.parent)
 # Suffix chain collapse
 double_suffix = (root / "file.txt").with_suffix(".tmp").with_suffix(".json")
 print("Suffix chain:", double_suffix)
-# -> WithSuffixExpr(base=JoinExpr(...), suffix='.json') — .tmp is gone
+# -> JoinExpr(ParamExpr, LiteralExpr("file.json")) — .tmp is gone, .json is folded in
 
 # Connectivity: rebasing
 config = RelativePath(base=root, relative=P("config") / "settings.yaml")
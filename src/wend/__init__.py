@@ -6,250 +6,595 @@ Build path expressions symbolically, resolve them later with concrete bindings.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from pathlib import Path
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path, PurePath
 from string.templatelib import Template
-from typing import Any
+from typing import Any, cast
+from weakref import WeakValueDictionary
 
 
 # Parameters (late binding slots)
 
 
-@dataclass(frozen=True)
 class Param:
     """A named slot to be filled at resolution time."""
 
-    name: str
+    __slots__ = ("name", "_expr")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Built once so joins don't wrap the param afresh each time
+        self._expr = ParamExpr.create(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Param):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash((Param, self.name))
 
     def __truediv__(self, other: PathExpr | str | Param) -> PathExpr:
-        if isinstance(other, Param):
-            return ParamExpr(self) / ParamExpr(other)
-        return ParamExpr(self) / other
+        return JoinExpr.create(self._expr, _as_expr(other))
 
     def __rtruediv__(self, other: str) -> PathExpr:
-        return LiteralExpr(other) / ParamExpr(self)
+        return JoinExpr.create(_as_expr(other), self._expr)
 
     def __repr__(self) -> str:
         return f"Param({self.name!r})"
 
 
+# Template opcodes: (_LITERAL, text, ""), (_PARAM, name, spec), (_VALUE, value, spec)
+_LITERAL, _PARAM, _VALUE = range(3)
+
+
+# Code generation
+
+
+# Format spec characters that are safe to inline into generated f-string source
+_INLINE_SPEC_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789<>=^+- #,_.%"
+)
+
+
+def _stash(ns: dict[str, Any], value: Any) -> str:
+    """Bind a constant into a codegen namespace, returning the name it is bound to."""
+    name = f"_L{len(ns)}"
+    ns[name] = value
+    return name
+
+
 # Path Expressions (composable, deferred)
 
 
+# Structurally equal nodes share one instance while any of them is alive
+_INTERN: WeakValueDictionary[tuple[Any, ...], PathExpr] = WeakValueDictionary()
+
+
+def _intern[E: PathExpr](cls: type[E], *args: Any) -> E:
+    """Return the live node of `cls` over `args`, constructing one only on a miss.
+
+    The key is built from the constructor arguments, so a hit builds no node.
+    """
+    key = cls._key(*args)
+    node = _INTERN.get(key)
+    if node is None:
+        node = _INTERN[key] = cls(*args)
+    return cast(E, node)
+
+
+def _intern_rewritten(cls: type[PathExpr], *args: Any) -> PathExpr:
+    """As `_intern`, but simplifying a newly constructed node.
+
+    Only nodes no rule rewrites are registered: anything a rule returns already came
+    from another `create`.
+    """
+    key = cls._key(*args)
+    node = _INTERN.get(key)
+    if node is None:
+        candidate = cls(*args)
+        node = _simplify(candidate)
+        if node is candidate:
+            _INTERN[key] = node
+    return node
+
+
+def _as_expr(other: PathExpr | str | Path | Param) -> PathExpr:
+    """Coerce an operand of `/` to a path expression."""
+    if isinstance(other, PathExpr):
+        return other
+    if isinstance(other, Param):
+        return other._expr
+    return LiteralExpr.create(other)
+
+
+def _simplify(expr: PathExpr) -> PathExpr:
+    """Apply rewrite rules until the expression stops changing.
+
+    Every rule shrinks the tree, so this terminates within its height.
+    """
+    while (rewritten := expr._rewrite()) is not expr:
+        expr = rewritten
+    return expr
+
+
 class PathExpr:
-    """Base class for path expressions. Everything is deferred."""
+    """Base class for path expressions. Everything is deferred.
+
+    Nodes are slotted and treated as immutable once constructed.
+    """
+
+    __slots__ = ("_params", "_compiled", "_resolved", "_constant_path", "__weakref__")
+    __match_args__: tuple[str, ...] = ()
+
+    _params: frozenset[str]
+    _compiled: Callable[[dict[str, Any]], Path] | None
+    _resolved: bool
+    _constant_path: Path | None
 
     def __truediv__(self, other: PathExpr | str | Param) -> PathExpr:
-        if isinstance(other, Param):
-            right = ParamExpr(other)
-        elif isinstance(other, PathExpr):
-            right = other
-        else:
-            right = LiteralExpr(other)
-        return JoinExpr.create(self, right)
+        return JoinExpr.create(self, _as_expr(other))
 
     def __rtruediv__(self, other: str) -> PathExpr:
-        return JoinExpr.create(LiteralExpr(other), self)
+        return JoinExpr.create(_as_expr(other), self)
 
     @property
     def parent(self) -> PathExpr:
         return ParentExpr.create(self)
 
     def with_name(self, name: str) -> PathExpr:
-        return WithNameExpr(self, name)
+        return WithNameExpr.create(self, name)
 
     def with_suffix(self, suffix: str) -> PathExpr:
         return WithSuffixExpr.create(self, suffix)
 
-    def required_params(self) -> set[str]:
+    def required_params(self) -> frozenset[str]:
         """Return all parameter names needed to resolve this expression."""
-        raise NotImplementedError
+        return self._params
 
     def resolve(self, bindings: dict[str, Any] | None = None) -> Path:
         """Resolve to a concrete Path with the given bindings."""
+        if self._constant_path is not None:
+            return self._constant_path
+        if not self._params:
+            # Folded on first use rather than at construction, so nodes discarded by
+            # interning or rewriting never fold and folding errors surface here
+            path = self._constant_path = Path(self._resolve_str({}))
+            return path
         bindings = bindings or {}
-        missing = self.required_params() - set(bindings.keys())
-        if missing:
-            raise ValueError(f"Missing bindings: {missing}")
-        cache: dict[int, Path] = {}
-        return self._resolve(bindings, cache)
-
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        """Internal resolve with memoization cache."""
+        if not self._params <= bindings.keys():
+            raise ValueError(f"Missing bindings: {self._params - bindings.keys()}")
+        if self._compiled is None and not self._resolved:
+            # Compiling costs an exec, which an expression resolved only once never
+            # earns back, so the first resolve walks the tree instead
+            self._resolved = True
+            return Path(self._resolve_str(bindings))
+        return self._compile()(bindings)
+
+    def resolve_many(self, bindings_list: Iterable[dict[str, Any]]) -> list[Path]:
+        """Resolve once per set of bindings, compiling the expression only once."""
+        resolver = self._compile()
+        params = self._params
+        paths = []
+        for bindings in bindings_list:
+            if not params <= bindings.keys():
+                raise ValueError(f"Missing bindings: {params - bindings.keys()}")
+            paths.append(resolver(bindings))
+        return paths
+
+    def _compile(self) -> Callable[[dict[str, Any]], Path]:
+        """Compile the expression tree into a single function of the bindings."""
+        compiled = self._compiled
+        if compiled is None:
+            ns: dict[str, Any] = {
+                "Path": Path,
+                "_fspath": os.fspath,
+                "_join": os.path.join,
+            }
+            src = f"def _r(b):\n    return Path({self._emit(ns)})\n"
+            exec(src, ns)
+            compiled = ns["_r"]
+            self._compiled = compiled
+        return compiled
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        """Python source for a str expression over bindings `b` resolving this node.
+
+        Constants are bound into `ns`.
+        """
         raise NotImplementedError
 
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        """Internal resolve to a path string, bindings already validated.
+
+        Strings are joined directly and only the root is turned into a Path.
+        """
+        raise NotImplementedError
+
+    def _rewrite(self) -> PathExpr:
+        """One algebraic rewrite step, or `self` if no rule applies."""
+        return self
+
+    @classmethod
+    def _key(cls, *args: Any) -> tuple[Any, ...]:
+        """Intern key of the node constructed from `args`.
+
+        Nodes hash by identity, and children are already interned, so child nodes
+        go into the key directly.
+        """
+        return (cls, *args)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__match_args__
+        )
+        return f"{type(self).__name__}({fields})"
+
 
-@dataclass(frozen=True)
 class LiteralExpr(PathExpr):
     """A concrete string/path segment."""
 
-    value: str | Path
+    __slots__ = ("value", "_path", "_str")
+    __match_args__ = ("value",)
+
+    def __init__(self, value: str | Path) -> None:
+        self.value = value
+        # Path parses lazily, and the root Path normalises resolved strings, so a str
+        # is joined as given rather than formatted through Path here
+        self._path = value if isinstance(value, Path) else Path(value)
+        self._str = os.fspath(value)
+        self._params = frozenset()
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = self._path
 
-    def required_params(self) -> set[str]:
-        return set()
+    @staticmethod
+    def create(value: str | Path) -> LiteralExpr:
+        """Construct, sharing any live equal literal."""
+        return _intern(LiteralExpr, value)
 
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = Path(self.value)
-        cache[id(self)] = result
-        return result
+    @classmethod
+    def _key(cls, value: str | Path) -> tuple[Any, ...]:
+        # Pure and concrete paths compare equal, so the type keeps their values apart
+        return (cls, type(value), value)
+
+    @staticmethod
+    def _fold(path: Path) -> LiteralExpr:
+        """Literal for a folded path, spelled canonically so equal folds are shared."""
+        return LiteralExpr.create(os.fspath(path))
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        # Stashed rather than inlined, so no repr of a user value reaches the source
+        return _stash(ns, self._str)
+
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        return self._str
 
 
-@dataclass(frozen=True)
 class ParamExpr(PathExpr):
     """A parameter reference—resolved from bindings."""
 
-    param: Param
+    __slots__ = ("param",)
+    __match_args__ = ("param",)
+
+    def __init__(self, param: Param) -> None:
+        self.param = param
+        self._params = frozenset((param.name,))
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
+
+    @staticmethod
+    def create(param: Param) -> ParamExpr:
+        """Construct, sharing any live reference to the same parameter."""
+        return _intern(ParamExpr, param)
+
+    @classmethod
+    def _key(cls, param: Param) -> tuple[Any, ...]:
+        # By name: the key must not hold the Param, which holds this node
+        return (cls, param.name)
 
-    def required_params(self) -> set[str]:
-        return {self.param.name}
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"_fspath(b[{self.param.name!r}])"
 
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = Path(bindings[self.param.name])
-        cache[id(self)] = result
-        return result
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        value: str | os.PathLike[str] = bindings[self.param.name]
+        return os.fspath(value)
 
 
-@dataclass(frozen=True)
 class TemplateExpr(PathExpr):
     """A t-string template with interpolations."""
 
-    template: Template
-    _params: frozenset[str] = field(init=False, repr=False)
+    __slots__ = ("template", "_ops")
+    __match_args__ = ("template",)
 
-    def __post_init__(self) -> None:
+    def __init__(self, template: Template) -> None:
+        self.template = template
         params = set()
-        for interp in self.template.interpolations:
-            if isinstance(interp.value, Param):
-                params.add(interp.value.name)
-        object.__setattr__(self, "_params", frozenset(params))
-
-    def required_params(self) -> set[str]:
-        return set(self._params)
-
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        parts = []
-        for item in self.template:
+        ops: list[tuple[int, Any, str]] = []
+        for item in template:
             if isinstance(item, str):
-                parts.append(item)
+                ops.append((_LITERAL, item, ""))
+            elif isinstance(item.value, Param):
+                params.add(item.value.name)
+                ops.append((_PARAM, item.value.name, item.format_spec))
             else:
-                value = item.value
-                if isinstance(value, Param):
-                    value = bindings[value.name]
-                parts.append(format(value, item.format_spec))
-        result = Path("".join(parts))
-        cache[id(self)] = result
-        return result
+                ops.append((_VALUE, item.value, item.format_spec))
+        self._params = frozenset(params)
+        self._ops = tuple(ops)
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
+
+    @staticmethod
+    def create(template: Template) -> TemplateExpr:
+        """Construct, sharing any live expression over the same template."""
+        return _intern(TemplateExpr, template)
+
+    @classmethod
+    def _key(cls, template: Template) -> tuple[Any, ...]:
+        # Templates hold arbitrary interpolated values, so key on identity
+        return (cls, id(template))
+
+    def _fstring(self, ns: dict[str, Any]) -> str:
+        """Python source formatting the template as one f-string over bindings `b`."""
+        # Adjacent f-string literals concatenate into one f-string at compile time
+        pieces = []
+        for kind, arg, spec in self._ops:
+            if kind == _LITERAL:
+                text = arg.replace("{", "{{").replace("}", "}}")
+                pieces.append(f"f{text!r}")
+                continue
+            ref = f"b[{arg!r}]" if kind == _PARAM else _stash(ns, arg)
+            if spec and not _INLINE_SPEC_CHARS.issuperset(spec):
+                spec = f"{{{_stash(ns, spec)}}}"
+            pieces.append(f'f"{{{ref}:{spec}}}"' if spec else f'f"{{{ref}}}"')
+        return " ".join(pieces) or repr("")
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"({self._fstring(ns)})"
+
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        parts: list[str] = []
+        append = parts.append
+        for kind, arg, spec in self._ops:
+            if kind == _LITERAL:
+                append(arg)
+                continue
+            value = bindings[arg] if kind == _PARAM else arg
+            append(value if not spec and type(value) is str else format(value, spec))
+        return "".join(parts)
 
 
-@dataclass(frozen=True)
 class JoinExpr(PathExpr):
-    """Path join: left / right"""
+    """Path join: left / right
+
+    Longer chains of joins are flattened into a `MultiJoinExpr`.
+    """
 
-    left: PathExpr
-    right: PathExpr
+    __slots__ = ("left", "right")
+    __match_args__ = ("left", "right")
+
+    def __init__(self, left: PathExpr, right: PathExpr) -> None:
+        self.left = left
+        self.right = right
+        self._params = left._params | right._params
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
+
+    @property
+    def parts(self) -> tuple[PathExpr, ...]:
+        return (self.left, self.right)
 
     @staticmethod
     def create(left: PathExpr, right: PathExpr) -> PathExpr:
-        """Construct with constant folding."""
-        # Fold Literal / Literal -> Literal
-        if isinstance(left, LiteralExpr) and isinstance(right, LiteralExpr):
-            return LiteralExpr(Path(left.value) / right.value)
-        return JoinExpr(left, right)
-
-    def required_params(self) -> set[str]:
-        return self.left.required_params() | self.right.required_params()
-
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = self.left._resolve(bindings, cache) / self.right._resolve(
-            bindings, cache
+        """Construct with flattening and constant folding."""
+        return MultiJoinExpr.create((left, right))
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"_join({self.left._emit(ns)}, {self.right._emit(ns)})"
+
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        return os.path.join(
+            self.left._resolve_str(bindings), self.right._resolve_str(bindings)
         )
-        cache[id(self)] = result
-        return result
 
 
-@dataclass(frozen=True)
+class MultiJoinExpr(PathExpr):
+    """Path join of three or more parts: parts[0] / parts[1] / ..."""
+
+    __slots__ = ("parts",)
+    __match_args__ = ("parts",)
+
+    def __init__(self, parts: tuple[PathExpr, ...]) -> None:
+        self.parts = parts
+        self._params = frozenset().union(*(part._params for part in parts))
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
+
+    @staticmethod
+    def create(parts: Iterable[PathExpr]) -> PathExpr:
+        """Construct from join operands, flattening nested joins.
+
+        Adjacent literals are folded, and the result is a single part, a binary
+        `JoinExpr` or a `MultiJoinExpr` depending on how many parts remain.
+        """
+        flat: list[PathExpr] = []
+        for part in parts:
+            items = part.parts if isinstance(part, _JOINS) else (part,)
+            for item in items:
+                # Fold Literal / Literal -> Literal
+                prev = flat[-1] if flat else None
+                if isinstance(item, LiteralExpr) and isinstance(prev, LiteralExpr):
+                    item = LiteralExpr._fold(prev._path / item._path)
+                    flat.pop()
+                flat.append(item)
+        if len(flat) == 1:
+            return flat[0]
+        if len(flat) == 2:
+            return _intern(JoinExpr, *flat)
+        return _intern(MultiJoinExpr, tuple(flat))
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"_join({', '.join(part._emit(ns) for part in self.parts)})"
+
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        return os.path.join(*[part._resolve_str(bindings) for part in self.parts])
+
+
+_JOINS = (JoinExpr, MultiJoinExpr)
+
+
 class ParentExpr(PathExpr):
-    """Parent of a path expression."""
+    """Parent of a path expression.
+
+    Rewrites assume a param or template on the right of a join is one component.
+    The parent of a rename or resuffix is taken from the path before it. Invalid
+    names and suffixes are rejected when that node is created, but the ValueError
+    the rename raises for a path with no name, such as ".", is skipped.
+    """
+
+    __slots__ = ("child",)
+    __match_args__ = ("child",)
 
-    child: PathExpr
+    def __init__(self, child: PathExpr) -> None:
+        self.child = child
+        self._params = child._params
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
 
     @staticmethod
     def create(child: PathExpr) -> PathExpr:
         """Construct with algebraic simplification."""
-        # parent(a / b) = a (when b is single component)
-        if isinstance(child, JoinExpr):
-            # Check if right side is a single component (no further joins)
-            if isinstance(child.right, (LiteralExpr, ParamExpr, TemplateExpr)):
-                return child.left
+        return _intern_rewritten(ParentExpr, child)
+
+    def _rewrite(self) -> PathExpr:
+        child = self.child
+        if isinstance(child, _JOINS):
+            *head, last = child.parts
+            if isinstance(last, LiteralExpr):
+                path = last._path
+                # parent(a / "b/c") = a / "b"
+                if path.parent != Path("."):
+                    return MultiJoinExpr.create((*head, LiteralExpr._fold(path.parent)))
+                # parent(a / ".") = parent(a)
+                if not path.name:
+                    return ParentExpr.create(MultiJoinExpr.create(head))
+                return MultiJoinExpr.create(head)
+            # parent(a / b) = a (when b is single component)
+            if isinstance(last, (ParamExpr, TemplateExpr)):
+                return MultiJoinExpr.create(head)
+        # Renaming or resuffixing leaves the parent unchanged
+        if isinstance(child, (WithNameExpr, WithSuffixExpr)):
+            return ParentExpr.create(child.base)
         # parent(Literal) can be folded
         if isinstance(child, LiteralExpr):
-            return LiteralExpr(Path(child.value).parent)
-        return ParentExpr(child)
+            return LiteralExpr._fold(child._path.parent)
+        return self
 
-    def required_params(self) -> set[str]:
-        return self.child.required_params()
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"str(Path({self.child._emit(ns)}).parent)"
 
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = self.child._resolve(bindings, cache).parent
-        cache[id(self)] = result
-        return result
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        # Via Path rather than os.path.dirname, which keeps trailing "/" and "."
+        return str(Path(self.child._resolve_str(bindings)).parent)
 
 
-@dataclass(frozen=True)
 class WithNameExpr(PathExpr):
     """Replace the final component name."""
 
-    base: PathExpr
-    name: str
+    __slots__ = ("base", "name")
+    __match_args__ = ("base", "name")
 
-    def required_params(self) -> set[str]:
-        return self.base.required_params()
+    def __init__(self, base: PathExpr, name: str) -> None:
+        self.base = base
+        self.name = name
+        self._params = base._params
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
 
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = self.base._resolve(bindings, cache).with_name(self.name)
-        cache[id(self)] = result
-        return result
+    @staticmethod
+    def create(base: PathExpr, name: str) -> PathExpr:
+        """Construct with name folding.
+
+        The name is checked here, as rewrites can drop this node before it resolves.
+        """
+        PurePath("x").with_name(name)
+        return _intern_rewritten(WithNameExpr, base, name)
+
+    def _rewrite(self) -> PathExpr:
+        base, name = self.base, self.name
+        # A new name overrides any earlier name or suffix change
+        if isinstance(base, (WithNameExpr, WithSuffixExpr)):
+            return WithNameExpr.create(base.base, name)
+        # Literal can be folded
+        if isinstance(base, LiteralExpr):
+            return LiteralExpr._fold(base._path.with_name(name))
+        # (a / "b.txt").with_name(n) -> a / n
+        if isinstance(base, _JOINS):
+            *head, last = base.parts
+            if isinstance(last, LiteralExpr) and last._path.name:
+                renamed = LiteralExpr._fold(last._path.with_name(name))
+                return MultiJoinExpr.create((*head, renamed))
+        return self
+
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"str(Path({self.base._emit(ns)}).with_name({self.name!r}))"
+
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        return str(Path(self.base._resolve_str(bindings)).with_name(self.name))
 
 
-@dataclass(frozen=True)
 class WithSuffixExpr(PathExpr):
     """Change suffix of a path."""
 
-    base: PathExpr
-    suffix: str
+    __slots__ = ("base", "suffix")
+    __match_args__ = ("base", "suffix")
+
+    def __init__(self, base: PathExpr, suffix: str) -> None:
+        self.base = base
+        self.suffix = suffix
+        self._params = base._params
+        self._compiled = None
+        self._resolved = False
+        self._constant_path = None
 
     @staticmethod
     def create(base: PathExpr, suffix: str) -> PathExpr:
-        """Construct with suffix chain collapse."""
-        # path.with_suffix(".a").with_suffix(".b") -> path.with_suffix(".b")
-        if isinstance(base, WithSuffixExpr):
-            return WithSuffixExpr(base.base, suffix)
+        """Construct with suffix chain collapse.
+
+        The suffix is checked here, as rewrites can drop this node before it resolves.
+        """
+        PurePath("x").with_suffix(suffix)
+        return _intern_rewritten(WithSuffixExpr, base, suffix)
+
+    def _rewrite(self) -> PathExpr:
+        base, suffix = self.base, self.suffix
+        # path.with_suffix(".a").with_suffix(".b") -> path.with_suffix(".b"), only
+        # when ".a" is one suffix: ".a.b" or "" would leave a suffix behind
+        if isinstance(base, WithSuffixExpr) and base.suffix.count(".") == 1:
+            return WithSuffixExpr.create(base.base, suffix)
         # Literal can be folded
         if isinstance(base, LiteralExpr):
-            return LiteralExpr(Path(base.value).with_suffix(suffix))
-        return WithSuffixExpr(base, suffix)
+            return LiteralExpr._fold(base._path.with_suffix(suffix))
+        # (a / "b.txt").with_suffix(s) -> a / "b{s}"
+        if isinstance(base, _JOINS):
+            *head, last = base.parts
+            if isinstance(last, LiteralExpr) and last._path.name:
+                resuffixed = LiteralExpr._fold(last._path.with_suffix(suffix))
+                return MultiJoinExpr.create((*head, resuffixed))
+        return self
 
-    def required_params(self) -> set[str]:
-        return self.base.required_params()
+    def _emit(self, ns: dict[str, Any]) -> str:
+        return f"str(Path({self.base._emit(ns)}).with_suffix({self.suffix!r}))"
 
-    def _resolve(self, bindings: dict[str, Any], cache: dict[int, Path]) -> Path:
-        if id(self) in cache:
-            return cache[id(self)]
-        result = self.base._resolve(bindings, cache).with_suffix(self.suffix)
-        cache[id(self)] = result
-        return result
+    def _resolve_str(self, bindings: dict[str, Any]) -> str:
+        return str(Path(self.base._resolve_str(bindings)).with_suffix(self.suffix))
 
 
 # Convenience constructors
@@ -257,28 +602,35 @@ class WithSuffixExpr(PathExpr):
 
 def P(path: str | Path) -> LiteralExpr:
     """Literal path expression."""
-    return LiteralExpr(path)
+    return LiteralExpr.create(path)
 
 
 def T(template: Template) -> TemplateExpr:
     """Template path expression from a t-string."""
-    return TemplateExpr(template)
+    return TemplateExpr.create(template)
 
 
 # Connectivity (rebasing)
 
 
-@dataclass(frozen=True)
 class RelativePath:
     """A path defined relative to a base, preserving the relation."""
 
-    base: PathExpr
-    relative: PathExpr
+    __slots__ = ("base", "relative", "_expr")
+    __match_args__ = ("base", "relative")
+
+    def __init__(self, base: PathExpr, relative: PathExpr) -> None:
+        self.base = base
+        self.relative = relative
+        self._expr = base / relative
+
+    def __repr__(self) -> str:
+        return f"RelativePath(base={self.base!r}, relative={self.relative!r})"
 
     @property
     def expr(self) -> PathExpr:
         """The full path expression."""
-        return self.base / self.relative
+        return self._expr
 
     def rebase(self, new_base: PathExpr) -> RelativePath:
         """Create equivalent path under a different base."""
@@ -287,5 +639,5 @@ class RelativePath:
     def resolve(self, bindings: dict[str, Any] | None = None) -> Path:
         return self.expr.resolve(bindings)
 
-    def required_params(self) -> set[str]:
+    def required_params(self) -> frozenset[str]:
         return self.expr.required_params()
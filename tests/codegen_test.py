@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from wend import Param, T
+
+
+def test_compiled_resolve_rebinds():
+    root = Param("root")
+    idx = Param("idx")
+
+    expr = root / "data" / T(t"part_{idx:02d}.bin")
+
+    assert expr.resolve({"root": "/a", "idx": 1}) == Path("/a/data/part_01.bin")
+    # The first resolve is interpreted, later ones share the compiled resolver,
+    # which must not capture earlier bindings
+    assert expr.resolve({"root": "/b", "idx": 2}) == Path("/b/data/part_02.bin")
+    assert expr.resolve({"root": "/c", "idx": 3}) == Path("/c/data/part_03.bin")
+
+
+def test_template_braces_survive_codegen():
+    idx = Param("idx")
+
+    expr = T(t"{{raw}}_{idx}")
+
+    assert expr.resolve({"idx": 3}) == Path("{raw}_3")
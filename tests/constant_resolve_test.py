@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+
+from wend import P, T
+
+
+def test_constant_expression_resolves_without_bindings():
+    expr = P("/tmp") / T(t"run_{3:02d}.log")
+
+    assert expr.required_params() == set()
+    assert expr.resolve() == Path("/tmp/run_03.log")
+    assert expr.resolve() is expr.resolve()
+
+
+def test_constant_folding_errors_raise_on_resolve():
+    here = "."
+    expr = T(t"{here}").with_name("x")
+
+    with pytest.raises(ValueError):
+        expr.resolve()
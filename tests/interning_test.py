@@ -0,0 +1,43 @@
+import gc
+import weakref
+
+from wend import P, Param, RelativePath
+
+
+def test_equal_subtrees_share_identity():
+    root = Param("root")
+
+    first = root / "data" / Param("dataset")
+    second = Param("root") / "data" / Param("dataset")
+
+    assert first is second
+    assert first.parent is root / "data"
+    assert P("/home") / "user" is P("/home/user")
+
+
+def test_literal_value_is_kept_as_given():
+    # Equivalent literals built earlier must not leak their spelling into later ones
+    dotted = P("x/./y")
+    folded = P("/home") / "user"
+
+    assert P("x/y").value == "x/y"
+    assert repr(P("/home/user")) == "LiteralExpr(value='/home/user')"
+    assert dotted.value == "x/./y"
+    assert folded.resolve() == P("/home/user").resolve()
+
+
+def test_relative_path_expr_is_shared():
+    rel = RelativePath(base=Param("root"), relative=P("config") / "settings.yaml")
+
+    assert rel.expr is rel.expr
+
+
+def test_interned_nodes_are_released():
+    # The parent of `param / "data"` is the param's own expression node
+    expr = (Param("transient") / "data").parent
+    ref = weakref.ref(expr)
+
+    del expr
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from wend import JoinExpr, LiteralExpr, MultiJoinExpr, Param
+
+
+def test_join_chain_flattens():
+    root = Param("root")
+    dataset = Param("dataset")
+
+    expr = root / "data" / dataset / "train.csv"
+
+    assert isinstance(expr, MultiJoinExpr)
+    assert len(expr.parts) == 4
+    assert expr.resolve({"root": "/x", "dataset": "d"}) == Path("/x/data/d/train.csv")
+
+
+def test_adjacent_literals_fold_when_flattened():
+    root = Param("root")
+
+    expr = root / "a" / "b"
+
+    assert isinstance(expr, JoinExpr)
+    assert isinstance(expr.right, LiteralExpr)
+    assert expr.resolve({"root": "/x"}) == Path("/x/a/b")
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from wend import JoinExpr, Param
 
 
@@ -12,3 +14,54 @@ def test_parent_simplifies_join():
     # "b" is dropped structurally
     assert isinstance(parent, JoinExpr)
     assert parent.resolve({"root": "/x"}) == Path("/x/a")
+
+
+def test_parent_folds_into_literal():
+    root = Param("root")
+    expr = root / "a/b"
+
+    parent = expr.parent
+
+    # The literal is trimmed rather than dropped
+    assert isinstance(parent, JoinExpr)
+    assert parent.resolve({"root": "/x"}) == Path("/x/a")
+
+
+def test_parent_skips_suffix_change():
+    root = Param("root")
+    expr = (root / "a" / "b").with_suffix(".x")
+
+    parent = expr.parent
+
+    assert parent is root / "a"
+    assert parent.resolve({"root": "/x"}) == Path("/x/a")
+
+
+def test_parent_skips_suffix_change_of_param():
+    root = Param("root")
+    name = Param("name")
+    expr = (root / "a" / name).with_suffix(".x")
+
+    parent = expr.parent
+
+    assert parent is root / "a"
+    assert parent.resolve({"root": "/x"}) == Path("/x/a")
+
+
+def test_parent_skips_rename_of_param():
+    root = Param("root")
+    name = Param("name")
+    expr = (root / "a" / name).with_name("other.txt")
+
+    parent = expr.parent
+
+    assert parent is root / "a"
+    assert parent.resolve({"root": "/x"}) == Path("/x/a")
+
+
+def test_parent_of_invalid_suffix_raises():
+    name = Param("name")
+
+    # The parent rule drops the resuffix, so the suffix must be rejected up front
+    with pytest.raises(ValueError):
+        (Param("root") / name).with_suffix("json").parent
@@ -1,4 +1,4 @@
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 from wend import Param
 
@@ -9,3 +9,24 @@ def test_param_resolution():
 
     path = expr.resolve({"root": "/tmp"})
     assert path == Path("/tmp/file.txt")
+
+
+def test_path_binding_resolution():
+    root = Param("root")
+    expr = root / "file.txt"
+
+    path = expr.resolve({"root": Path("/tmp")})
+    assert path == Path("/tmp/file.txt")
+
+
+def test_path_like_literal_resolution():
+    class Segment:
+        def __fspath__(self) -> str:
+            return "x"
+
+    root = Param("root")
+
+    for segment in (PurePosixPath("x"), Segment(), Path("x")):
+        expr = root / segment
+        for _ in range(2):
+            assert expr.resolve({"root": "/a"}) == Path("/a/x")
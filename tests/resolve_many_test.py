@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from wend import Param, T
+
+
+def test_resolve_many():
+    root = Param("root")
+    idx = Param("idx")
+
+    expr = root / T(t"chunk_{idx:02d}.parquet")
+
+    paths = expr.resolve_many({"root": "/data", "idx": i} for i in range(3))
+
+    assert paths == [
+        Path("/data/chunk_00.parquet"),
+        Path("/data/chunk_01.parquet"),
+        Path("/data/chunk_02.parquet"),
+    ]
+
+
+def test_resolve_many_missing_bindings_raises():
+    root = Param("root")
+    dataset = Param("dataset")
+
+    expr = root / dataset
+
+    with pytest.raises(ValueError, match="Missing bindings"):
+        expr.resolve_many([{"root": "/a", "dataset": "x"}, {"root": "/b"}])
@@ -1,9 +1,21 @@
 from pathlib import Path
 
-from wend import P
+import pytest
+
+from wend import P, Param
 
 
 def test_with_name():
     expr = P("/tmp/data.txt").with_name("other.csv")
 
     assert expr.resolve() == Path("/tmp/other.csv")
+
+
+def test_with_name_rejects_invalid_name():
+    name = Param("name")
+
+    # A later rename would otherwise drop the invalid one before it resolves
+    with pytest.raises(ValueError):
+        (P("a") / name).with_name("").with_name("n")
+    with pytest.raises(ValueError):
+        (P("a") / name).with_suffix("json").with_name("n")
@@ -1,13 +1,35 @@
 from pathlib import Path
 
-from wend import Param, WithSuffixExpr
+from wend import JoinExpr, LiteralExpr, Param, WithSuffixExpr
 
 
 def test_suffix_chain_collapse():
     root = Param("root")
+    stem = Param("stem")
 
-    expr = (root / "file.txt").with_suffix(".tmp").with_suffix(".json")
+    expr = (root / stem).with_suffix(".tmp").with_suffix(".json")
 
     # Only the last suffix survives
     assert isinstance(expr, WithSuffixExpr)
+    assert expr.resolve({"root": "/x", "stem": "file.txt"}) == Path("/x/file.json")
+
+
+def test_suffix_pushed_into_literal():
+    root = Param("root")
+
+    expr = (root / "file.txt").with_suffix(".tmp").with_suffix(".json")
+
+    # The suffix change is folded into the trailing literal
+    assert isinstance(expr, JoinExpr)
+    assert isinstance(expr.right, LiteralExpr)
     assert expr.resolve({"root": "/x"}) == Path("/x/file.json")
+
+
+def test_suffix_chain_keeps_compound_suffix():
+    root = Param("root")
+    stem = Param("stem")
+
+    expr = (root / stem).with_suffix(".a.b").with_suffix(".json")
+
+    # Only the ".b" of ".a.b" is replaced, as with pathlib
+    assert expr.resolve({"root": "/x", "stem": "file.txt"}) == Path("/x/file.a.json")